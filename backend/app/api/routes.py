@@ -10,14 +10,15 @@ from app.schemas.blog import (
     BlogListResponse,
     MessageResponse
 )
-from app.services.ai_service import hf_service
+from app.services.ai_service import HuggingFaceService, get_hf_service
 
 router = APIRouter()
 
 @router.post("/generate", response_model=BlogResponse, status_code=201)
 def generate_blog(
     request: BlogGenerateRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    hf_service: HuggingFaceService = Depends(get_hf_service)
 ):
     """Generate a new blog post using AI"""
     
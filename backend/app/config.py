@@ -1,5 +1,6 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Literal
 
 class Settings(BaseSettings):
  # Database
@@ -17,6 +18,13 @@ class Settings(BaseSettings):
  APP_VERSION: str = "1.0.0"
  APP_ENVIRONMENT: str = "development"
 
+ # Startup
+ # "always" runs create_all on every boot, "version" skips it when the
+ # stored schema marker matches SCHEMA_VERSION, "skip" never touches the schema.
+ SCHEMA_CHECK_MODE: Literal["always", "version", "skip"] = "always"
+ SCHEMA_VERSION: str = "1"
+ STARTUP_PROFILE: bool = False
+
  @property
  def cors_origins_list(self) -> List[str]:
      return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
@@ -29,4 +37,7 @@ class Settings(BaseSettings):
     extra="ignore"
     )
  
-settings = Settings()
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    """Build settings on first use and reuse them afterwards."""
+    return Settings()
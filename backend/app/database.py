@@ -1,18 +1,27 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
-from app.config import settings
+from typing import Optional
+from app.config import get_settings
 
-# Create the SQLAlchemy engine
-engine = create_engine(
- settings.DATABASE_URL,
- pool_pre_ping=True,
- pool_size=10,
- max_overflow=20,
- echo=settings.APP_ENVIRONMENT == "development"
- )
+# Create the SQLAlchemy engine on first use instead of at import
+@lru_cache
+def get_engine() -> Engine:
+    settings = get_settings()
+    return create_engine(
+     settings.DATABASE_URL,
+     pool_pre_ping=True,
+     pool_size=10,
+     max_overflow=20,
+     echo=settings.APP_ENVIRONMENT == "development"
+     )
 
 # Create SessionLocal
-sessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@lru_cache
+def get_session_local() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 # Create Base class for models
 class Base(DeclarativeBase):
@@ -20,8 +29,59 @@ class Base(DeclarativeBase):
 
 # Dependency for FastAPI routes
 def get_db():
-    db = sessionLocal()
+    db = get_session_local()()
     try:
         yield db
     finally:
         db.close()
+
+def _stored_schema_version(engine: Engine) -> Optional[str]:
+    """Read the schema marker, or None if the marker table is missing."""
+    from app.models.schema_version import SchemaVersion
+
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                select(SchemaVersion.version).where(SchemaVersion.id == 1)
+            ).scalar()
+    except DBAPIError:
+        return None
+
+def _write_schema_version(engine: Engine, version: str, exists: bool) -> None:
+    """Store the schema marker, tolerating replicas that boot at the same time."""
+    from app.models.schema_version import SchemaVersion
+
+    if not exists:
+        try:
+            with engine.begin() as conn:
+                conn.execute(insert(SchemaVersion).values(id=1, version=version))
+            return
+        except IntegrityError:
+            # Another replica inserted the row first, fall through and update it
+            pass
+
+    with engine.begin() as conn:
+        conn.execute(
+            update(SchemaVersion).where(SchemaVersion.id == 1).values(version=version)
+        )
+
+def ensure_schema() -> bool:
+    """Create missing tables according to SCHEMA_CHECK_MODE.
+
+    Returns True if create_all ran, False if it was skipped.
+    """
+    settings = get_settings()
+    if settings.SCHEMA_CHECK_MODE == "skip":
+        return False
+
+    engine = get_engine()
+    stored_version = _stored_schema_version(engine)
+    if settings.SCHEMA_CHECK_MODE == "version" and stored_version == settings.SCHEMA_VERSION:
+        return False
+
+    Base.metadata.create_all(bind=engine)
+
+    # Record the version so the next boot in "version" mode can skip create_all
+    if stored_version != settings.SCHEMA_VERSION:
+        _write_schema_version(engine, settings.SCHEMA_VERSION, exists=stored_version is not None)
+    return True
@@ -1,17 +1,29 @@
-from fastapi import FastAPI, APIRouter
-from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from app.utils.startup_profile import profiler
 
-from app.config import settings
-from app.database import engine, Base
-from app.api import routes
+from app.config import get_settings
+
+# Settings are built at import: the FastAPI constructor and CORS middleware need them
+settings = get_settings()
+
+with profiler.tracking_imports(enabled=settings.STARTUP_PROFILE):
+    from fastapi import FastAPI, APIRouter
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from app.database import ensure_schema
+    from app.api import routes
 
 # Create database tables
 @asynccontextmanager
 async def lifespan(app: APIRouter):
-   
+
    # Startup
-   Base.metadata.create_all(bind=engine)
+   # Creating the engine loads the database driver, so keep timing imports
+   with profiler.tracking_imports(enabled=settings.STARTUP_PROFILE), profiler.phase("schema check"):
+      ensure_schema()
+   profiler.mark_ready()
+   if settings.STARTUP_PROFILE:
+      profiler.print_report()
    yield
 
    # Shutdown
@@ -51,3 +63,9 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "healthy", "environment": settings.APP_ENVIRONMENT}
+
+# Startup profile endpoint, for tracking cold-start regressions
+if settings.STARTUP_PROFILE:
+    @app.get("/health/startup")
+    async def startup_profile():
+        return profiler.report()
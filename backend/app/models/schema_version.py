@@ -0,0 +1,13 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+class SchemaVersion(Base):
+    __tablename__ = "schema_version"
+
+    # Single-row marker table, the row always has id 1
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SchemaVersion(version='{self.version}')>"
@@ -1,7 +1,8 @@
 import requests
 import time
+from functools import lru_cache
 from typing import Dict
-from app.config import settings
+from app.config import get_settings
 from app.utils.post_processor import PostProcessor
 from app.services.seo_service import SEOService
 
@@ -9,6 +10,7 @@ class HuggingFaceService:
     """Hugging Face API integration using the Unified Inference Router."""
     
     def __init__(self):
+        settings = get_settings()
         self.api_url = "https://router.huggingface.co/v1/chat/completions"
         self.headers = {
             "Authorization": f"Bearer {settings.HUGGINGFACE_API_KEY}",
@@ -138,7 +140,7 @@ Write the complete blog post now:"""
         """Calls the HF Router with proper error handling."""
         
         # Model ID extraction
-        model_id = settings.HUGGINGFACE_MODEL.split(':')[0].strip()
+        model_id = get_settings().HUGGINGFACE_MODEL.split(':')[0].strip()
 
         payload = {
             "model": model_id,
@@ -226,5 +228,7 @@ Write the complete blog post now:"""
 
         raise Exception("Failed to generate content after multiple retries")
 
-# Global instance
-hf_service = HuggingFaceService()
\ No newline at end of file
+# Built on first use, injected into routes via Depends(get_hf_service)
+@lru_cache
+def get_hf_service() -> HuggingFaceService:
+    return HuggingFaceService()
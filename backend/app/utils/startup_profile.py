@@ -0,0 +1,162 @@
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+def _process_start_time() -> Optional[float]:
+    """Wall-clock time the current process was created (Linux only)."""
+    try:
+        with open("/proc/self/stat") as f:
+            # The command name may contain spaces, so split after its closing paren
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    # Field 22 (starttime) is in clock ticks since boot; fields[0] is field 3
+    started_after_boot = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    return time.time() - (uptime - started_after_boot)
+
+class _TimedLoader:
+    """Stand-in loader that times a module's execution, then steps aside."""
+
+    def __init__(self, profiler: "StartupProfiler", spec, loader):
+        self._profiler = profiler
+        self._spec = spec
+        self._loader = loader
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        # Extension modules do most of their work here
+        create_module = getattr(self._loader, "create_module", None)
+        if create_module is None:
+            return None
+        return self._profiler._time_module(spec.name, create_module, spec)
+
+    def exec_module(self, module) -> None:
+        # Put the real loader back so nothing outlives the import
+        self._spec.loader = self._loader
+        module.__loader__ = self._loader
+        self._profiler._time_module(self._spec.name, self._loader.exec_module, module)
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps every found spec in a _TimedLoader."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._thread_id = threading.get_ident()
+
+    def find_spec(self, fullname, path, target=None):
+        if threading.get_ident() != self._thread_id:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(self._profiler, spec, spec.loader)
+            return spec
+        return None
+
+class StartupProfiler:
+    """Record per-module import times, startup phases and time to ready."""
+
+    def __init__(self):
+        self.profiler_loaded_at = time.time()
+        self.process_started_at = _process_start_time()
+        self.phases: Dict[str, float] = {}
+        self.imports: Dict[str, float] = {}
+        self.ready_at: Optional[float] = None
+        self._import_stack: List[float] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block of startup work, e.g. the schema check."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    @contextmanager
+    def tracking_imports(self, enabled: bool = True):
+        """Time every module loaded inside the block.
+
+        Each module is charged only its own load time, not the time of the
+        modules it imports in turn. Modules loaded before the block, such as
+        those imported by app.config, are not seen; use `python -X importtime`
+        for the complete tree.
+        """
+        if not enabled:
+            yield
+            return
+
+        finder = _ImportTimingFinder(self)
+        sys.meta_path.insert(0, finder)
+        try:
+            yield
+        finally:
+            sys.meta_path.remove(finder)
+
+    def _time_module(self, name: str, load, *args):
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            result = load(*args)
+        except BaseException:
+            # Failed imports are not recorded; the parent keeps the time spent
+            self._import_stack.pop()
+            self.imports.pop(name, None)
+            raise
+
+        elapsed = time.perf_counter() - start
+        nested = self._import_stack.pop()
+        if self._import_stack:
+            self._import_stack[-1] += elapsed
+        self.imports[name] = round(self.imports.get(name, 0.0) + (elapsed - nested) * 1000, 2)
+        return result
+
+    def mark_ready(self) -> None:
+        """Mark the point where the app can serve its first request."""
+        self.ready_at = time.time()
+
+    def report(self, top: int = 25) -> Dict:
+        """Timings in milliseconds, with the slowest `top` module imports."""
+        time_to_ready = None
+        time_since_profiler_loaded = None
+        if self.ready_at is not None:
+            time_since_profiler_loaded = round((self.ready_at - self.profiler_loaded_at) * 1000, 2)
+            if self.process_started_at is not None:
+                time_to_ready = round((self.ready_at - self.process_started_at) * 1000, 2)
+
+        slowest_imports = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]
+        return {
+            "imports_self_ms": dict(slowest_imports),
+            "phases_ms": dict(self.phases),
+            "time_since_profiler_loaded_ms": time_since_profiler_loaded,
+            "time_to_ready_ms": time_to_ready
+        }
+
+    def print_report(self) -> None:
+        """Print the report to stdout, slowest entries first."""
+        report = self.report()
+        print("Startup profile:")
+        print("  slowest imports (self time):")
+        for name, ms in report["imports_self_ms"].items():
+            print(f"    {name}: {ms} ms")
+        for name, ms in sorted(report["phases_ms"].items(), key=lambda item: item[1], reverse=True):
+            print(f"  {name}: {ms} ms")
+        print(f"  since profiler loaded: {report['time_since_profiler_loaded_ms']} ms")
+        print(f"  time to ready (from process start): {report['time_to_ready_ms']} ms")
+
+# Global instance, imported first by app.main
+profiler = StartupProfiler()